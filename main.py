@@ -11,14 +11,20 @@ from gtts import gTTS
 import pygame
 import time
 import threading
+import concurrent.futures
+import queue
+import collections
 import os
 from PIL import Image, ImageTk
 import requests
 from io import BytesIO
 import uuid
+import hashlib
+import mmap
 import atexit
 import tempfile
-from bs4 import BeautifulSoup
+import shutil
+import html
 import webbrowser
 import random
 import json
@@ -33,6 +39,8 @@ import re
 WORDS_FOLDER = "words"  # Folder containing vocabulary files
 DEFAULT_VOCAB_FILE = ".All in one_14996.txt"  # Default vocabulary file name
 TEMP_AUDIO_PREFIX = "speech_"  # Prefix for temporary audio files
+SENTENCE_CACHE_FILE = ".sentence_cache.json"  # AI sentence cache, stored in WORDS_FOLDER
+AUDIO_CACHE_FOLDER = os.path.join(WORDS_FOLDER, ".audio_cache")  # Persistent text-to-speech cache
 
 # UI Configuration
 WINDOW_WIDTH = 800
@@ -45,21 +53,26 @@ CONTROL_FONT_SIZE = 14
 # Image Settings
 IMAGE_WIDTH = 250
 IMAGE_HEIGHT = 250
+IMAGE_CACHE_SIZE = 50  # Resized images kept in memory for revisited words
 
 # Audio Settings
 AUDIO_LANGUAGE = 'es'  # Language for text-to-speech (es = Spanish)
 AUDIO_PLAYBACK_RATE = 10  # Pygame clock tick rate during audio playback
+AUDIO_SYNTHESIS_TIMEOUT = 10  # Timeout for gTTS requests (seconds)
 
 # Learning Configuration
 TRANSLATION_DELAY = 5000  # Delay before showing translation (milliseconds)
 EXAM_TRIGGER_INTERVAL = 10  # Show exam after this many words
 EXAM_WORD_COUNT = 20  # Number of words to include in exam
 EXAM_CHOICES_COUNT = 4  # Number of multiple choice options
+PREFETCH_WORD_COUNT = 3  # Upcoming words whose sentences and images are fetched ahead
+IO_POOL_WORKERS = 4  # Background threads for prefetching network resources
 
 # AI Sentence Generation
 OLLAMA_MODEL = "llama3.2:3b-instruct-q4_K_M"  # Ollama model for sentence generation
 SENTENCES_PER_WORD = 3  # Number of example sentences to generate
 SENTENCE_WRAP_LENGTH = 600  # Maximum width for sentence text wrapping
+OLLAMA_PING_TIMEOUT = 3  # Timeout for the Ollama availability check (seconds)
 
 # Google Images Search
 GOOGLE_SEARCH_HEADERS = {"User-Agent": "Mozilla/5.0"}  # Headers for web requests
@@ -69,88 +82,182 @@ IMAGE_SEARCH_TIMEOUT = 5  # Timeout for image search requests (seconds)
 # VOCABULARY PARSING AND LOADING
 # =============================================================================
 
-def parse_vocabulary(text):
-    """Parse vocabulary from text file format: english,spanish"""
-    vocabulary = []
-    lines = text.strip().split("\n")
-    
-    for line in lines:
-        parts = re.split(r',', line)
-        if len(parts) < 2:
-            continue  # Skip lines that don't have both English and Spanish
-        english_words = parts[0].strip()
-        spanish_words = parts[1].strip()
-        
-        vocabulary.append({
-            "english": english_words,
-            "spanish": spanish_words
-        })
-    
-    return vocabulary
-
 def load_vocabulary_file(file_path=None):
-    """Load vocabulary from file with error handling"""
+    """Load vocabulary from file format: english,spanish
+    
+    Returns parallel (english, spanish) lists rather than one dict per word,
+    which keeps the 15k-word vocabulary compact.
+    """
     if file_path is None:
         file_path = os.path.join(WORDS_FOLDER, DEFAULT_VOCAB_FILE)
     
     try:
-        with open(file_path, "r", encoding="utf-8") as file:
-            text = file.read()
-        return parse_vocabulary(text)
+        english, spanish = [], []
+        with open(file_path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return english, spanish  # mmap cannot map an empty file
+            
+            # Scan the mapped bytes and decode only the two fields that are kept
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for line in iter(mm.readline, b""):
+                    # maxsplit=2 keeps only the first two fields; anything after
+                    # a second comma is ignored
+                    parts = line.split(b",", 2)
+                    if len(parts) < 2:
+                        continue  # Skip lines that don't have both English and Spanish
+                    english.append(parts[0].strip().decode("utf-8"))
+                    spanish.append(parts[1].strip().decode("utf-8"))
+        return english, spanish
     except FileNotFoundError:
         print(f"Vocabulary file not found: {file_path}")
-        return []
+        return [], []
     except Exception as e:
         print(f"Error loading vocabulary file: {e}")
-        return []
+        return [], []
 
 # =============================================================================
 # AI INTEGRATION (OLLAMA)
 # =============================================================================
 
-# Check if Ollama is available
-OLLAMA_AVAILABLE = False
+# Strips leading list numbering such as "1. " or "2) " from generated sentences
+_NUM_PREFIX_RE = re.compile(r'^\s*\d+[.)]\s*')
+
+# Whether the Ollama service is usable; None until check_ollama_available() runs
+OLLAMA_AVAILABLE = None
+_OLLAMA_CHECK_LOCK = threading.Lock()
 try:
     import ollama
-    # Try to ping ollama service to see if it's running
-    try:
-        ollama.list()  # This will fail if ollama service isn't running
-        OLLAMA_AVAILABLE = True
-        print("Ollama is available - AI sentence generation enabled")
-    except Exception as e:
-        print(f"Ollama is installed but service not running: {e}")
-        print("Sentence generation will use fallback examples")
 except ImportError:
+    OLLAMA_AVAILABLE = False
     print("Ollama not installed - sentence generation will use fallback examples")
 
-def get_example_sentences(word, cancel_event):
-    """Generate example sentences using Ollama AI or fallback examples"""
-    if OLLAMA_AVAILABLE:
+def check_ollama_available():
+    """Ping the Ollama service on first use and remember whether it is running"""
+    global OLLAMA_AVAILABLE
+    with _OLLAMA_CHECK_LOCK:
+        if OLLAMA_AVAILABLE is None:
+            try:
+                # This will fail if ollama service isn't running
+                ollama.Client(timeout=OLLAMA_PING_TIMEOUT).list()
+                OLLAMA_AVAILABLE = True
+                print("Ollama is available - AI sentence generation enabled")
+            except Exception as e:
+                OLLAMA_AVAILABLE = False
+                print(f"Ollama is installed but service not running: {e}")
+                print("Sentence generation will use fallback examples")
+    return OLLAMA_AVAILABLE
+
+# =============================================================================
+# SENTENCE CACHE
+# =============================================================================
+
+_SENT_CACHE_PATH = os.path.join(WORDS_FOLDER, SENTENCE_CACHE_FILE)
+_SENT_CACHE_LOCK = threading.Lock()
+_sent_cache_dirty = False
+
+def load_sentence_cache():
+    """Load previously generated AI sentences from disk"""
+    try:
+        with open(_SENT_CACHE_PATH, "r", encoding="utf-8") as file:
+            cache = json.load(file)
+        if not isinstance(cache, dict):
+            print("Ignoring sentence cache: unexpected format")
+            return {}
+        return cache
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Error loading sentence cache: {e}")
+        return {}
+
+def save_sentence_cache():
+    """Write the AI sentence cache to disk if it has changed"""
+    global _sent_cache_dirty
+    with _SENT_CACHE_LOCK:
+        if not _sent_cache_dirty:
+            return
+        snapshot = dict(_SENT_CACHE)
+        _sent_cache_dirty = False
+    
+    try:
+        temp_path = _SENT_CACHE_PATH + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(snapshot, file, ensure_ascii=False)
+        os.replace(temp_path, _SENT_CACHE_PATH)
+    except Exception as e:
+        print(f"Error saving sentence cache: {e}")
+
+def sentence_cache_key(word):
+    """Build the cache key for a word's generated sentences"""
+    return f"{OLLAMA_MODEL}|{SENTENCES_PER_WORD}|{word}"
+
+_SENT_CACHE = load_sentence_cache()
+atexit.register(save_sentence_cache)
+
+def get_example_sentences(word, is_cancelled=lambda: False, on_sentence=None):
+    """Generate example sentences using Ollama AI or fallback examples
+    
+    is_cancelled is polled while generating; once it returns True, generation stops.
+    If on_sentence is given, it is called as on_sentence(index, sentence) for each
+    AI sentence as soon as its line has been generated.
+    """
+    global _sent_cache_dirty
+    # Cached AI sentences are used even when Ollama is currently unavailable
+    key = sentence_cache_key(word)
+    with _SENT_CACHE_LOCK:
+        cached = _SENT_CACHE.get(key)
+    if isinstance(cached, list) and cached:
+        return list(cached)
+    
+    if check_ollama_available():
         try:
-            if cancel_event.is_set():
+            if is_cancelled():
                 return ["", "", ""]
                 
             prompt = f"Escribe {SENTENCES_PER_WORD} oraciones diferentes de nivel intermedio usando la palabra en español '{word}'. Salida solo las {SENTENCES_PER_WORD} oraciones en {SENTENCES_PER_WORD} lines, nada más, sin explicaciones ni texto adicional. Solo las {SENTENCES_PER_WORD} oraciones."
             
-            # Call Ollama API with the prompt
-            response = ollama.generate(
+            # Call Ollama API with the prompt, streaming so each line can be used as it arrives
+            stream = ollama.generate(
                 model=OLLAMA_MODEL,
                 prompt=prompt,
                 system="You are a helpful Spanish language assistant. Respond only with the requested sentences in Spanish.",
-                stream=False
+                stream=True
             )
             
-            if cancel_event.is_set():
-                return ["", "", ""]
+            sentences = []
+            
+            def add_sentence(line):
+                # Clean up sentences (remove numbers, extra spaces, etc.)
+                sentence = _NUM_PREFIX_RE.sub('', line.strip(), count=1)
+                if sentence and len(sentences) < SENTENCES_PER_WORD:
+                    sentences.append(sentence)
+                    if on_sentence is not None:
+                        on_sentence(len(sentences) - 1, sentence)
+            
+            buffer = ""
+            for chunk in stream:
+                if is_cancelled():
+                    return ["", "", ""]
+                buffer += chunk['response']
+                # Extract complete lines, keeping any partial line in the buffer
+                *lines, buffer = buffer.split('\n')
+                for line in lines:
+                    add_sentence(line)
+                if len(sentences) >= SENTENCES_PER_WORD:
+                    break
+            else:
+                add_sentence(buffer)
                 
-            # Extract sentences from response
-            sentences = response['response'].strip().split('\n')
-            # Clean up sentences (remove numbers, extra spaces, etc.)
-            sentences = [s.strip().replace('1. ', '').replace('2. ', '').replace('3. ', '') for s in sentences if s.strip()]
+            if is_cancelled():
+                return ["", "", ""]
+            
+            # Only cache complete replies so a short one is regenerated next time
+            if len(sentences) == SENTENCES_PER_WORD:
+                with _SENT_CACHE_LOCK:
+                    _SENT_CACHE[key] = list(sentences)
+                    _sent_cache_dirty = True
             
             # Ensure we have exactly the right number of sentences
-            if len(sentences) > SENTENCES_PER_WORD:
-                sentences = sentences[:SENTENCES_PER_WORD]
             while len(sentences) < SENTENCES_PER_WORD:
                 sentences.append(f"Ejemplo con {word}.")
                 
@@ -186,22 +293,94 @@ def get_example_sentences(word, cancel_event):
 # IMAGE SEARCH FUNCTIONALITY
 # =============================================================================
 
+# Shared session so image searches and downloads reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update(GOOGLE_SEARCH_HEADERS)
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+_SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# Match <img> tags in the raw search results page, then the tag's own src attribute
+# (not data-src and the like), so tags are counted the same way an HTML parser would
+_IMG_TAG_RE = re.compile(rb'<img\b[^>]*>', re.IGNORECASE)
+_IMG_SRC_RE = re.compile(rb'\ssrc\s*=\s*(?:"([^"]*)"|\'([^\']*)\')', re.IGNORECASE)
+
 def google_image_search(query):
     """Fetch the first image from Google Images."""
     try:
         search_url = f"https://www.google.com/search?tbm=isch&q={query}"
-        response = requests.get(search_url, headers=GOOGLE_SEARCH_HEADERS, timeout=IMAGE_SEARCH_TIMEOUT)
+        response = _SESSION.get(search_url, timeout=IMAGE_SEARCH_TIMEOUT)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.text, "html.parser")
-            img_tags = soup.find_all("img")
-            if len(img_tags) > 1:
-                img_url = img_tags[1]["src"]  # First image result
-                return img_url
+            # The first <img> is the Google logo; the second is the first image result
+            img_tags = _IMG_TAG_RE.finditer(response.content)
+            next(img_tags, None)
+            img_tag = next(img_tags, None)
+            if img_tag is not None:
+                src = _IMG_SRC_RE.search(img_tag.group(0))
+                if src is not None:
+                    img_url = (src.group(1) or src.group(2)).decode("utf-8", errors="replace")
+                    return html.unescape(img_url)
     except Exception as e:
         print(f"Error searching for image: {e}")
     return None
 
+# =============================================================================
+# BACKGROUND WORKERS
+# =============================================================================
+
+class DaemonThreadPool:
+    """Minimal executor whose workers are daemon threads
+    
+    ThreadPoolExecutor joins its workers at interpreter exit, so a prefetch stuck
+    in a network call or waiting for a model to load would keep the app from
+    quitting. These workers are abandoned at exit instead.
+    """
+    
+    def __init__(self, max_workers):
+        self._jobs = queue.SimpleQueue()
+        self._max_workers = max_workers
+        self._shutdown = False
+        for _ in range(max_workers):
+            threading.Thread(target=self._worker, daemon=True).start()
+            
+    def submit(self, fn, *args, **kwargs):
+        """Schedule fn(*args, **kwargs) and return a concurrent.futures.Future"""
+        if self._shutdown:
+            raise RuntimeError("cannot submit after shutdown")
+        future = concurrent.futures.Future()
+        self._jobs.put((future, fn, args, kwargs))
+        return future
+        
+    def _worker(self):
+        """Run queued jobs until a shutdown sentinel arrives"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            future, fn, args, kwargs = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+                
+    def shutdown(self, cancel_futures=False):
+        """Stop accepting jobs, optionally cancel queued ones, and let workers exit"""
+        self._shutdown = True
+        if cancel_futures:
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is not None:
+                    job[0].cancel()
+        for _ in range(self._max_workers):
+            self._jobs.put(None)
+
 # =============================================================================
 # MAIN APPLICATION CLASS
 # =============================================================================
@@ -216,36 +395,68 @@ class VocabularyTrainer:
         self.setup_ui()
         self.load_vocabulary()
         
+        # Probe Ollama in the background so the window appears immediately
+        threading.Thread(target=self.check_ollama_status, daemon=True).start()
+        
     def setup_window(self):
         """Configure the main window"""
         self.root.title("Spanish Vocabulary Trainer")
         self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         
-        # Show Ollama status in title
-        status = "with AI sentences" if OLLAMA_AVAILABLE else "with basic sentences"
+    def check_ollama_status(self):
+        """Check Ollama availability and refresh the status display"""
+        check_ollama_available()
+        self.root.after(0, self.update_ollama_status)
+        
+    def update_ollama_status(self):
+        """Show Ollama status in the title and status label"""
+        if OLLAMA_AVAILABLE is None:
+            status, status_text = "checking AI sentences", "⏳ Checking for AI sentences..."
+        elif OLLAMA_AVAILABLE:
+            status, status_text = "with AI sentences", "🤖 AI-powered sentences"
+        else:
+            status, status_text = "with basic sentences", "📝 Basic example sentences"
         self.root.title(f"Spanish Vocabulary Trainer ({status})")
+        self.status_label.config(text=status_text)
         
     def initialize_pygame(self):
         """Initialize pygame mixer for audio"""
         pygame.mixer.init()
         
     def setup_temp_directory(self):
-        """Create temporary directory for audio files"""
+        """Create temporary directory and persistent audio cache directory"""
         self.temp_dir = tempfile.mkdtemp()
         atexit.register(self.cleanup_temp_files)
         
+        self._audio_cache_dir = AUDIO_CACHE_FOLDER
+        try:
+            os.makedirs(self._audio_cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"Error creating audio cache directory, using temp directory: {e}")
+            self._audio_cache_dir = self.temp_dir
+        
     def initialize_variables(self):
         """Initialize application state variables"""
-        self.vocabulary = []
-        self.current_index = 0
+        self.english = []  # English translations, parallel to self.spanish
+        self.spanish = []  # Spanish words
+        self.order = []  # Shuffled indices into english/spanish
+        self.current_index = 0  # Position in self.order
+        self._vocab_loading = False  # True while the default file loads in the background
         self.audio_lock = threading.Lock()
         self.translation_timer = None
         self.current_audio_file = None
-        self.recent_words = []  # Track words for exams
+        self.recent_words = collections.deque(maxlen=EXAM_WORD_COUNT)  # (spanish, english) pairs for exams
         self.words_since_last_exam = 0  # Counter for exam triggering
         self.current_sentences = []  # Store current word's sentences
         self.sentence_thread = None  # Track the sentence generation thread
-        self.cancel_event = threading.Event()  # Event to signal cancellation
+        self._gen_id = 0  # Bumped on every Next; work started for an older id is stale
+        self._prefetch = {}  # Prefetched sentences keyed by Spanish word (images go to _image_cache)
+        self._prefetch_pending = {}  # In-flight prefetches: (kind, key) -> {"done", "sentences", "listener"}
+        self._prefetch_lock = threading.Lock()
+        self._image_cache = collections.OrderedDict()  # Resized images keyed by English word, LRU order
+        self._image_cache_lock = threading.Lock()
+        self._io_pool = DaemonThreadPool(max_workers=IO_POOL_WORKERS)
+        self._closing = False  # Set on close so running pool jobs stop early
         
     def setup_ui(self):
         """Create the user interface"""
@@ -253,9 +464,9 @@ class VocabularyTrainer:
         self.main_frame.pack(expand=True, fill='both', padx=20, pady=20)
         
         # Status label
-        status_text = "🤖 AI-powered sentences" if OLLAMA_AVAILABLE else "📝 Basic example sentences"
-        self.status_label = tk.Label(self.main_frame, text=status_text, font=("Arial", 10), fg="gray")
+        self.status_label = tk.Label(self.main_frame, text="", font=("Arial", 10), fg="gray")
         self.status_label.pack(pady=5)
+        self.update_ollama_status()
         
         # Main word display
         self.word_label = tk.Label(self.main_frame, text="", font=("Arial", MAIN_WORD_FONT_SIZE, "bold"))
@@ -289,14 +500,17 @@ class VocabularyTrainer:
             sentence_frame = tk.Frame(self.sentences_frame)
             sentence_frame.pack(fill='x', pady=5)
             
-            play_btn = tk.Button(sentence_frame, text="🔊", font=("Arial", 12))
+            # Buttons are bound once by index and read the current sentence when clicked
+            play_btn = tk.Button(sentence_frame, text="🔊", font=("Arial", 12),
+                                 command=lambda i=i: self._dispatch_play(i))
             play_btn.pack(side='left', padx=5)
             
             sentence_label = tk.Label(sentence_frame, text="", font=("Arial", SENTENCE_FONT_SIZE), 
                                      wraplength=SENTENCE_WRAP_LENGTH, justify='left')
             sentence_label.pack(side='left', fill='x', expand=True)
             
-            copy_btn = tk.Button(sentence_frame, text="📋", font=("Arial", 12))
+            copy_btn = tk.Button(sentence_frame, text="📋", font=("Arial", 12),
+                                 command=lambda i=i: self._dispatch_copy(i))
             copy_btn.pack(side='right', padx=5)
             
             self.sentence_labels.append((sentence_label, play_btn, copy_btn))
@@ -321,12 +535,36 @@ class VocabularyTrainer:
                                     command=self.show_next_word)
         self.next_button.pack(side='left', padx=10)
         
+    def set_vocabulary(self, english, spanish):
+        """Replace the vocabulary and start a new shuffled pass through it"""
+        self.english = english
+        self.spanish = spanish
+        self.order = list(range(len(english)))
+        random.shuffle(self.order)
+        self.current_index = 0
+        with self._prefetch_lock:
+            self._prefetch.clear()  # Sentences prefetched for the old vocabulary
+        
     def load_vocabulary(self):
-        """Load the default vocabulary file"""
-        self.vocabulary = load_vocabulary_file()
-        if self.vocabulary:
-            random.shuffle(self.vocabulary)
-            print(f"Loaded {len(self.vocabulary)} words from vocabulary file")
+        """Load the default vocabulary file in the background so the window appears immediately"""
+        self._vocab_loading = True
+        threading.Thread(target=self._load_vocab_bg, daemon=True).start()
+        
+    def _load_vocab_bg(self):
+        """Parse the default vocabulary file off the UI thread"""
+        english, spanish = load_vocabulary_file()
+        self.root.after(0, self._finish_loading_vocabulary, english, spanish)
+        
+    def _finish_loading_vocabulary(self, english, spanish):
+        """Install the background-loaded vocabulary on the main thread"""
+        if not self._vocab_loading:
+            return  # Another file was loaded from the dialog in the meantime
+        self._vocab_loading = False
+        
+        # Keep any words added by hand while the file was loading
+        self.set_vocabulary(english + self.english, spanish + self.spanish)
+        if self.order:
+            print(f"Loaded {len(self.order)} words from vocabulary file")
         else:
             print("No vocabulary loaded. Use 'Load File' button to select a vocabulary file.")
             
@@ -339,11 +577,11 @@ class VocabularyTrainer:
         )
         
         if file_path:
-            self.vocabulary = load_vocabulary_file(file_path)
-            if self.vocabulary:
-                random.shuffle(self.vocabulary)
-                self.current_index = 0
-                messagebox.showinfo("Success", f"Loaded {len(self.vocabulary)} words from {os.path.basename(file_path)}")
+            english, spanish = load_vocabulary_file(file_path)
+            if english:
+                self._vocab_loading = False
+                self.set_vocabulary(english, spanish)
+                messagebox.showinfo("Success", f"Loaded {len(english)} words from {os.path.basename(file_path)}")
             else:
                 messagebox.showerror("Error", "Failed to load vocabulary file")
                 
@@ -367,7 +605,9 @@ class VocabularyTrainer:
             spanish = spanish_entry.get().strip()
             english = english_entry.get().strip()
             if spanish and english:
-                self.vocabulary.append({"spanish": spanish, "english": english})
+                self.order.append(len(self.spanish))
+                self.spanish.append(spanish)
+                self.english.append(english)
                 messagebox.showinfo("Success", f"Added: {spanish} = {english}")
                 dialog.destroy()
             else:
@@ -393,16 +633,19 @@ class VocabularyTrainer:
         
         self.exam_answers = {}
         
-        for idx, word in enumerate(exam_words):
+        # Distinct answers, built once and sampled per question
+        all_english = list(dict.fromkeys(english for _, english in exam_words))
+        distractor_count = min(EXAM_CHOICES_COUNT - 1, len(all_english) - 1)
+        
+        for idx, (spanish, correct) in enumerate(exam_words):
             question_frame = tk.Frame(exam_frame)
             question_frame.pack(fill='x', pady=5)
             
-            tk.Label(question_frame, text=word['spanish'], font=('Arial', 14), width=20, anchor='w').pack(side='left', padx=10)
+            tk.Label(question_frame, text=spanish, font=('Arial', 14), width=20, anchor='w').pack(side='left', padx=10)
             
-            correct = word['english']
-            other_answers = [w['english'] for w in exam_words if w != word]
-            random.shuffle(other_answers)
-            options = other_answers[:EXAM_CHOICES_COUNT-1] + [correct]
+            # Sample one extra so the correct answer can be dropped if it was picked
+            sampled = random.sample(all_english, distractor_count + 1)
+            options = [a for a in sampled if a != correct][:distractor_count] + [correct]
             random.shuffle(options)
             
             selected = tk.StringVar()
@@ -445,18 +688,71 @@ class VocabularyTrainer:
         
         tk.Button(exam_window, text="Close", command=exam_window.destroy).pack(pady=10)
         
-    def text_to_speech(self, text, lang=AUDIO_LANGUAGE):
-        """Generate and play text-to-speech audio"""
+    def _write_audio_file(self, filename, write):
+        """Call write(path) on a unique partial file, then move it into place"""
+        # Writing to a unique name first means concurrent requests never see a partial file
+        partial_filename = f"{filename}.{uuid.uuid4()}.part"
         try:
-            temp_filename = os.path.join(self.temp_dir, f"{TEMP_AUDIO_PREFIX}{uuid.uuid4()}.mp3")
+            write(partial_filename)
+            os.replace(partial_filename, filename)
+        except Exception:
+            # Don't leave a half-written file behind
+            try:
+                os.remove(partial_filename)
+            except OSError:
+                pass
+            raise
+            
+    def synthesize_speech(self, text, lang=AUDIO_LANGUAGE, persist=True):
+        """Return an MP3 for text, generating it with gTTS if needed
+        
+        With persist=False (used for prefetched sentence audio) a new clip goes to
+        the session's temp directory. It is copied into the persistent audio cache
+        only when it is requested with persist=True, i.e. when it is actually played.
+        """
+        key = hashlib.sha1((lang + '|' + text).encode("utf-8")).hexdigest()
+        name = f"{TEMP_AUDIO_PREFIX}{key}.mp3"
+        cache_filename = os.path.join(self._audio_cache_dir, name)
+        temp_filename = os.path.join(self.temp_dir, name)
+        
+        if os.path.exists(cache_filename):
+            return cache_filename
+        if os.path.exists(temp_filename):
+            if not persist:
+                return temp_filename
+            self._write_audio_file(cache_filename,
+                                   lambda path: shutil.copyfile(temp_filename, path))
+            return cache_filename
+            
+        filename = cache_filename if persist else temp_filename
+        tts = gTTS(text=text, lang=lang, timeout=AUDIO_SYNTHESIS_TIMEOUT)
+        self._write_audio_file(filename, tts.save)
+        return filename
+        
+    def prefetch_speech(self, text, my_gen):
+        """Synthesize a sentence's audio ahead of time unless the word has changed"""
+        if self._closing or self._is_stale(my_gen):
+            return None
+        return self.synthesize_speech(text, persist=False)
+        
+    def text_to_speech(self, text, lang=AUDIO_LANGUAGE, my_gen=None):
+        """Generate and play text-to-speech audio
+        
+        When my_gen is given, playback is skipped if the user has moved on to
+        another word by the time the audio is ready.
+        """
+        try:
+            # Synthesis happens outside the lock so only mixer access is serialized
+            temp_filename = self.synthesize_speech(text, lang)
             
             with self.audio_lock:
-                tts = gTTS(text=text, lang=lang)
-                tts.save(temp_filename)
+                if my_gen is not None and self._is_stale(my_gen):
+                    return None
                 pygame.mixer.music.load(temp_filename)
                 pygame.mixer.music.play()
+                clock = pygame.time.Clock()
                 while pygame.mixer.music.get_busy():
-                    pygame.time.Clock().tick(AUDIO_PLAYBACK_RATE)
+                    clock.tick(AUDIO_PLAYBACK_RATE)
                 pygame.mixer.music.stop()
                 pygame.mixer.music.unload()
                 
@@ -471,154 +767,329 @@ class VocabularyTrainer:
             sentence = self.current_sentences[index]
             threading.Thread(target=self.text_to_speech, args=(sentence,), daemon=True).start()
             
-    def copy_to_clipboard(self, text):
-        """Copy text to clipboard with visual feedback"""
-        def reset_button_text(btn, original_text):
-            btn.config(text=original_text)
-            
-        pyperclip.copy(text)
-        # Visual feedback that text was copied
-        for label, play_btn, copy_btn in self.sentence_labels:
-            if label.cget("text") == text:
-                copy_btn.config(text="✓")
-                self.root.after(1000, lambda btn=copy_btn: reset_button_text(btn, "📋"))
-                break
+    def copy_to_clipboard(self, index):
+        """Copy the sentence at index to clipboard with visual feedback"""
+        pyperclip.copy(self.current_sentences[index])
+        # Visual feedback on the row's own button that text was copied
+        _, _, copy_btn = self.sentence_labels[index]
+        copy_btn.config(text="✓")
+        self.root.after(1000, lambda: copy_btn.config(text="📋"))
                 
+    def _dispatch_play(self, index):
+        """Play button handler for the sentence row at index"""
+        if index < len(self.current_sentences) and self.current_sentences[index]:
+            self.play_sentence(index)
+            
+    def _dispatch_copy(self, index):
+        """Copy button handler for the sentence row at index"""
+        if index < len(self.current_sentences) and self.current_sentences[index]:
+            self.copy_to_clipboard(index)
+            
     def update_example_sentences(self):
         """Update the UI with current example sentences"""
-        for i, (label, play_btn, copy_btn) in enumerate(self.sentence_labels):
+        for i, (label, _, _) in enumerate(self.sentence_labels):
             if i < len(self.current_sentences):
-                sentence = self.current_sentences[i]
-                label.config(text=sentence)
-                
-                # Set the button command (using a function factory to avoid closure issues)
-                def make_play_cmd(idx):
-                    return lambda: self.play_sentence(idx)
-                
-                def make_copy_cmd(sentence_text):
-                    return lambda: self.copy_to_clipboard(sentence_text)
-                
-                play_btn.config(command=make_play_cmd(i))
-                copy_btn.config(command=make_copy_cmd(sentence))
+                label.config(text=self.current_sentences[i])
             else:
                 label.config(text="")
-                play_btn.config(command=lambda: None)
-                copy_btn.config(command=lambda: None)
                 
-    def fetch_sentences_thread(self, word):
-        """Generate sentences in a separate thread"""
-        # Reset cancel event for new request
-        self.cancel_event.clear()
+    def _is_stale(self, my_gen):
+        """Whether work started for generation my_gen has been superseded"""
+        return my_gen != self._gen_id
+        
+    def _offset_from_current(self, order, position):
+        """Where a queue position is relative to the word on screen
+        
+        0 is the current word, negative means already passed and positive means
+        upcoming. None means the queue has been reshuffled or replaced since.
+        """
+        if order is not self.order:
+            return None
+        return position - (self.current_index - 1)
+        
+    def wait_for_prefetch(self, kind, key, my_gen):
+        """Wait for an in-flight prefetch of key; False if the word changed meanwhile"""
+        with self._prefetch_lock:
+            pending = self._prefetch_pending.get((kind, key))
+        if pending is not None:
+            while not pending["done"].wait(0.1):
+                if self._is_stale(my_gen):
+                    return False
+        return True
         
-        # Generate sentences
-        sentences = get_example_sentences(word, self.cancel_event)
+    def take_prefetched(self, key, my_gen):
+        """Pop prefetched sentences for key, waiting for them if they are still in flight
+        
+        Sentences that a running prefetch has already streamed are shown right away,
+        and the rest are shown as they arrive, so only the final list is waited for.
+        """
+        def listener(index, sentence):
+            self.on_sentence_generated(my_gen, index, sentence)
+            
+        arrived = []
+        with self._prefetch_lock:
+            pending = self._prefetch_pending.get(("sentences", key))
+            if pending is not None:
+                arrived = list(enumerate(pending["sentences"]))
+                pending["listener"] = listener
+        for index, sentence in arrived:
+            listener(index, sentence)
+            
+        if not self.wait_for_prefetch("sentences", key, my_gen):
+            return None
+        with self._prefetch_lock:
+            return self._prefetch.pop(key, None)
+            
+    def prefetch_item(self, kind, key, fetch, order, position):
+        """Run fetch(key, is_cancelled) for the word at a queue position unless it is already known
+        
+        Sentences are kept in self._prefetch; fetch_image stores images in the
+        bounded image cache itself.
+        """
+        def is_cancelled():
+            # Stop once the app closes or the user has moved past this word, so
+            # stale prefetches free the pool for the current word
+            if self._closing:
+                return True
+            offset = self._offset_from_current(order, position)
+            return offset is None or offset < 0
+            
+        pending_key = (kind, key)
+        with self._prefetch_lock:
+            if self._closing:
+                return
+            offset = self._offset_from_current(order, position)
+            if offset is None or offset <= 0:
+                return  # Already on screen or passed; the word fetches for itself
+            if kind == "sentences" and key in self._prefetch:
+                return
+            if pending_key in self._prefetch_pending:
+                return
+            pending = self._prefetch_pending[pending_key] = {
+                "done": threading.Event(),
+                "sentences": [],  # Sentences streamed so far
+                "listener": None  # Set by take_prefetched once the word is on screen
+            }
+            
+        def on_sentence(index, sentence):
+            with self._prefetch_lock:
+                pending["sentences"].append(sentence)
+                listener = pending["listener"]
+            if listener is not None:
+                listener(index, sentence)
+                
+        try:
+            if kind == "sentences":
+                result = fetch(key, is_cancelled, on_sentence=on_sentence)
+            else:
+                result = fetch(key, is_cancelled)
+            if kind == "sentences" and result is not None:
+                with self._prefetch_lock:
+                    if not is_cancelled():
+                        self._prefetch[key] = result
+        finally:
+            with self._prefetch_lock:
+                del self._prefetch_pending[pending_key]
+            pending["done"].set()
+            
+    def report_prefetch_error(self, future):
+        """Log the failure of a background prefetch job"""
+        if not future.cancelled() and future.exception() is not None:
+            print(f"Error prefetching: {future.exception()}")
+            
+    def prefetch_upcoming(self, start_index, count):
+        """Fetch sentences and images for the upcoming words in the queue concurrently"""
+        order = self.order
+        window = range(max(start_index - 1, 0), min(start_index + count, len(order)))
         
-        # Only update if not cancelled
-        if not self.cancel_event.is_set():
+        # Drop sentences for words outside the current word and the upcoming window
+        with self._prefetch_lock:
+            keep = {self.spanish[order[position]] for position in window}
+            for key in [key for key in self._prefetch if key not in keep]:
+                del self._prefetch[key]
+                
+        for position in window:
+            if position < start_index:
+                continue  # The current word is already being fetched
+            i = order[position]
+            futures = (
+                self._io_pool.submit(self.prefetch_item, "sentences", self.spanish[i],
+                                     get_example_sentences, order, position),
+                self._io_pool.submit(self.prefetch_item, "image", self.english[i],
+                                     self.fetch_image, order, position),
+            )
+            for future in futures:
+                future.add_done_callback(self.report_prefetch_error)
+            
+    def on_sentence_generated(self, my_gen, index, sentence):
+        """Show a streamed sentence as soon as it is generated (called from worker thread)"""
+        if not self._is_stale(my_gen):
+            self.root.after(0, self._set_sentence_text, my_gen, index, sentence)
+            
+    def _set_sentence_text(self, my_gen, index, sentence):
+        """Store and show one sentence on the main thread so its buttons work right away"""
+        if not self._is_stale(my_gen) and index < len(self.current_sentences):
+            self.current_sentences[index] = sentence
+            self.sentence_labels[index][0].config(text=sentence)
+            
+    def _set_sentences(self, my_gen, sentences):
+        """Store and show all sentences on the main thread unless the word has changed"""
+        if not self._is_stale(my_gen):
             self.current_sentences = sentences
+            self.update_example_sentences()
+            
+    def fetch_sentences_thread(self, word, my_gen):
+        """Generate sentences in a separate thread"""
+        # Generate sentences, reusing a prefetched result when there is one
+        sentences = self.take_prefetched(word, my_gen)
+        if sentences is None and not self._is_stale(my_gen):
+            sentences = get_example_sentences(
+                word,
+                is_cancelled=lambda: self._is_stale(my_gen),
+                on_sentence=lambda index, sentence: self.on_sentence_generated(my_gen, index, sentence)
+            )
+        
+        # Only update if the user has not moved on to another word
+        if sentences is not None and not self._is_stale(my_gen):
             # Update UI on main thread
-            self.root.after(0, self.update_example_sentences)
+            self.root.after(0, self._set_sentences, my_gen, sentences)
             
-    def load_image(self, word_english):
-        """Load and display image for the current word"""
+            # Synthesize sentence audio now so the speaker buttons play instantly
+            for sentence in sentences:
+                future = self._io_pool.submit(self.prefetch_speech, sentence, my_gen)
+                future.add_done_callback(self.report_prefetch_error)
+            
+    def fetch_image(self, word_english, is_cancelled=lambda: False):
+        """Download and resize the image for a word, reusing recently loaded images"""
+        with self._image_cache_lock:
+            photo = self._image_cache.get(word_english)
+            if photo is not None:
+                self._image_cache.move_to_end(word_english)
+                return photo
+                
+        if is_cancelled():
+            return None
         img_url = google_image_search(word_english)
-        if img_url and not self.cancel_event.is_set():
+        if img_url and not is_cancelled():
             try:
-                response = requests.get(img_url, timeout=IMAGE_SEARCH_TIMEOUT)
+                response = _SESSION.get(img_url, timeout=IMAGE_SEARCH_TIMEOUT)
                 if response.status_code == 200:
                     img_data = BytesIO(response.content)
                     img = Image.open(img_data)
+                    # Let the JPEG decoder downscale while decoding; LANCZOS does the final resize
+                    img.draft('RGB', (IMAGE_WIDTH * 2, IMAGE_HEIGHT * 2))
                     img = img.resize((IMAGE_WIDTH, IMAGE_HEIGHT), Image.Resampling.LANCZOS)
                     photo = ImageTk.PhotoImage(img)
                     
-                    # Update UI on main thread if not cancelled
-                    if not self.cancel_event.is_set():
-                        self.root.after(0, lambda: self.image_label.config(image=photo))
-                        self.image_label.image = photo
+                    with self._image_cache_lock:
+                        self._image_cache[word_english] = photo
+                        if len(self._image_cache) > IMAGE_CACHE_SIZE:
+                            self._image_cache.popitem(last=False)
+                    return photo
             except Exception as e:
                 print(f"Error loading image: {e}")
+        return None
+        
+    def _set_image(self, my_gen, photo):
+        """Show an image on the main thread unless the word has changed"""
+        if not self._is_stale(my_gen):
+            self.image_label.config(image=photo)
+            self.image_label.image = photo
+            
+    def load_image(self, word_english, my_gen):
+        """Load and display image for the current word"""
+        # A finished prefetch leaves the image in the image cache, so fetch_image returns it
+        photo = None
+        if self.wait_for_prefetch("image", word_english, my_gen):
+            photo = self.fetch_image(word_english, lambda: self._is_stale(my_gen))
+            
+        # Update UI on main thread if not cancelled
+        if photo is not None and not self._is_stale(my_gen):
+            self.root.after(0, self._set_image, my_gen, photo)
                 
     def show_next_word(self):
         """Display the next vocabulary word with all features"""
-        if not self.vocabulary:
-            messagebox.showwarning("No Vocabulary", "Please load a vocabulary file first.")
+        if not self.order:
+            if self._vocab_loading:
+                messagebox.showinfo("Loading", "The vocabulary is still loading…")
+            else:
+                messagebox.showwarning("No Vocabulary", "Please load a vocabulary file first.")
             return
             
-        # Cancel any ongoing operations
-        self.cancel_event.set()
+        # Start a new generation; in-flight work for the previous word sees it is stale
+        self._gen_id += 1
+        my_gen = self._gen_id
         
         if self.translation_timer is not None:
             self.root.after_cancel(self.translation_timer)
         
-        if self.current_index >= len(self.vocabulary):
+        if self.current_index >= len(self.order):
             self.current_index = 0
-            random.shuffle(self.vocabulary)  # Reshuffle when starting over
+            # Reshuffle into a new list when starting over so prefetches for the old pass go stale
+            self.order = random.sample(self.order, len(self.order))
         
-        word = self.vocabulary[self.current_index]
-        self.word_label.config(text=word["spanish"], fg="black")
+        i = self.order[self.current_index]
+        spanish, english = self.spanish[i], self.english[i]
+        self.word_label.config(text=spanish, fg="black")
         self.translation_label.config(text="")
         
         # Clear image
         self.image_label.config(image="")
         self.image_label.image = None
         
-        # Clear previous sentences while loading
+        # Clear previous sentences while loading; rows are filled in as sentences stream in
+        self.current_sentences = [""] * SENTENCES_PER_WORD
         loading_text = "Generating AI sentences..." if OLLAMA_AVAILABLE else "Loading example sentences..."
         for label, _, _ in self.sentence_labels:
             label.config(text=loading_text)
         
-        # Create a new cancel event for this word
-        self.cancel_event = threading.Event()
-        
         # Text to speech for the word
-        threading.Thread(target=self.text_to_speech, args=(word["spanish"],), daemon=True).start()
+        threading.Thread(target=self.text_to_speech, args=(spanish,),
+                         kwargs={"my_gen": my_gen}, daemon=True).start()
         
         # Start image loading first to display it immediately
-        image_thread = threading.Thread(target=self.load_image, args=(word["english"],), daemon=True)
+        image_thread = threading.Thread(target=self.load_image, args=(english, my_gen), daemon=True)
         image_thread.start()
         
         # Then start sentence generation in a separate thread
         self.sentence_thread = threading.Thread(
             target=self.fetch_sentences_thread,
-            args=(word["spanish"],),
+            args=(spanish, my_gen),
             daemon=True
         )
         self.sentence_thread.start()
         
         # Show translation after delay
         self.translation_timer = self.root.after(TRANSLATION_DELAY, 
-                                               lambda: self.translation_label.config(text=word["english"]))
+                                               lambda: self.translation_label.config(text=english))
         
         # Track words for exams
-        self.recent_words.append(word)
+        self.recent_words.append((spanish, english))
         self.words_since_last_exam += 1
         self.current_index += 1
         
         # Start exam after specified interval using previous words
         if self.words_since_last_exam >= EXAM_TRIGGER_INTERVAL and len(self.recent_words) >= EXAM_TRIGGER_INTERVAL:
-            exam_words = self.recent_words[-EXAM_WORD_COUNT:] if len(self.recent_words) >= EXAM_WORD_COUNT else self.recent_words
-            self.start_exam(exam_words)
+            # The deque only holds the last EXAM_WORD_COUNT words, so older words
+            # carry over into the next exam automatically
+            self.start_exam(list(self.recent_words))
             self.words_since_last_exam = 0
-            # Keep some words for next exam
-            self.recent_words = self.recent_words[-(EXAM_WORD_COUNT//2):]
+            
+        # Fetch the upcoming words in the background so Next is instant
+        self.prefetch_upcoming(self.current_index, PREFETCH_WORD_COUNT)
             
     def cleanup_temp_files(self):
-        """Clean up temporary audio files"""
-        try:
-            for filename in os.listdir(self.temp_dir):
-                file_path = os.path.join(self.temp_dir, filename)
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-            os.rmdir(self.temp_dir)
-        except Exception as e:
-            print(f"Error cleaning up temp directory: {e}")
+        """Clean up temporary audio files (the persistent audio cache is kept)"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
             
     def on_closing(self):
         """Handle application closing"""
         if self.translation_timer:
             self.root.after_cancel(self.translation_timer)
-        # Cancel any ongoing operations
-        self.cancel_event.set()
+        # Mark any ongoing operations as stale so running pool jobs stop early
+        self._gen_id += 1
+        self._closing = True
+        self._io_pool.shutdown(cancel_futures=True)
         pygame.mixer.quit()
         self.cleanup_temp_files()
         self.root.destroy()